@@ -6,23 +6,247 @@ Main Application File
 
 import os
 import sys
+import json
+import math
+import time
 import datetime
-from modules.auth import AuthSystem
-from modules.database import Database
-from modules.medicine_manager import MedicineManager
-from modules.reports import ReportGenerator
+
+# Rows shown per page in listings and report browsers
+PAGE_SIZE = 20
+
+# Columns expected in CSV/JSONL import files
+IMPORT_FIELDS = ("name", "category", "stock", "price", "expiry_date")
+
+# Row errors kept in an import summary; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+# Set MESAS_INSTRUMENT=1 to record per-operation call counts and latencies
+INSTRUMENT_ENV = "MESAS_INSTRUMENT"
+
+class PerfStats:
+    """Per-operation call counts and latency histograms"""
+    
+    # Upper bounds (ms) of the latency histogram buckets
+    BUCKETS_MS = (0.1, 1, 10, 100, 1000)
+    
+    def __init__(self):
+        self.operations = {}
+    
+    def record(self, name, elapsed_ms):
+        """Record one call of an operation"""
+        stats = self.operations.get(name)
+        if stats is None:
+            stats = self.operations[name] = {
+                "calls": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "histogram": [0] * (len(self.BUCKETS_MS) + 1)
+            }
+        stats["calls"] += 1
+        stats["total_ms"] += elapsed_ms
+        if elapsed_ms > stats["max_ms"]:
+            stats["max_ms"] = elapsed_ms
+        
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if elapsed_ms <= bound:
+                stats["histogram"][i] += 1
+                break
+        else:
+            stats["histogram"][-1] += 1
+    
+    def to_dict(self):
+        """Return statistics in a JSON-serializable form"""
+        labels = [f"<={b}ms" for b in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        result = {}
+        for name, stats in sorted(self.operations.items()):
+            result[name] = {
+                "calls": stats["calls"],
+                "total_ms": round(stats["total_ms"], 3),
+                "avg_ms": round(stats["total_ms"] / stats["calls"], 3),
+                "max_ms": round(stats["max_ms"], 3),
+                "histogram": dict(zip(labels, stats["histogram"]))
+            }
+        return result
+
+class Instrumented:
+    """Proxy that times every method call on the wrapped object"""
+    
+    def __init__(self, target, prefix, stats):
+        self._target = target
+        self._prefix = prefix
+        self._stats = stats
+    
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        
+        op_name = f"{self._prefix}.{name}"
+        stats = self._stats
+        
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                stats.record(op_name, (time.perf_counter() - start) * 1000)
+        return timed
+    
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._target, name, value)
+
+def read_medicine_file(path, batch_size=1000):
+    """Stream validated medicine rows from a CSV or JSONL file in batches"""
+    import csv
+    
+    # utf-8-sig strips the BOM that spreadsheet exports put before the header
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            # Lines are decoded per row during validation so one bad line
+            # is reported as a row error instead of aborting the import
+            records = ((line_no, line) for line_no, line in enumerate(f, 1) if line.strip())
+        else:
+            reader = csv.DictReader(f)
+            # line_num is the file line the record ended on, header included
+            records = ((reader.line_num, record) for record in reader)
+        
+        batch = []
+        for row_no, record in records:
+            batch.append((row_no, record))
+            if len(batch) >= batch_size:
+                yield _validate_medicine_rows(batch)
+                batch = []
+        if batch:
+            yield _validate_medicine_rows(batch)
+
+def _validate_medicine_rows(batch):
+    """Split a batch into valid (row, name, category, stock, price, expiry) rows and errors"""
+    valid = []
+    errors = []
+    for row_no, record in batch:
+        try:
+            if isinstance(record, str):
+                record = json.loads(record)
+            values = [record[f] for f in IMPORT_FIELDS]
+            for field, value in zip(IMPORT_FIELDS, values):
+                if value is None:
+                    raise ValueError(f"{field} is empty")
+            name, category, stock, price, expiry = values
+            name, category, expiry = str(name).strip(), str(category).strip(), str(expiry).strip()
+            # JSON numbers arrive already typed; CSV fields are strings
+            if isinstance(stock, bool) or isinstance(price, bool):
+                raise ValueError("stock and price must be numbers")
+            if isinstance(stock, float):
+                if not stock.is_integer():
+                    raise ValueError(f"stock must be a whole number: {stock}")
+                stock = int(stock)
+            else:
+                stock = int(str(stock).strip())
+            price = float(price if isinstance(price, (int, float)) else str(price).strip())
+            datetime.datetime.strptime(expiry, "%Y-%m-%d")
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            errors.append((row_no, f"invalid row: {e}"))
+            continue
+        if not name or not category or stock < 0 or not math.isfinite(price) or price < 0:
+            errors.append((row_no, "missing name/category, negative stock or invalid price"))
+            continue
+        valid.append((row_no, name, category, stock, price, expiry))
+    return valid, errors
+
+def import_medicines(medicine_manager, path, user_id, batch_size=1000):
+    """Bulk load medicines from a supplier manifest and report throughput"""
+    import csv
+    
+    imported = 0
+    rejected = 0
+    errors = []
+    read_error = None
+    start = time.perf_counter()
+    
+    def reject(row_no, message):
+        nonlocal rejected
+        rejected += 1
+        # Only the first few errors are kept so memory stays flat on bad files
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append((row_no, message))
+    
+    try:
+        for valid, batch_errors in read_medicine_file(path, batch_size):
+            for row_no, message in batch_errors:
+                reject(row_no, message)
+            for row_no, name, category, stock, price, expiry in valid:
+                success, message = medicine_manager.add_medicine(
+                    name, category, stock, price, expiry, user_id
+                )
+                if success:
+                    imported += 1
+                else:
+                    reject(row_no, message)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        # Earlier batches are already saved, so report how far the import got
+        read_error = f"Could not read file: {e}"
+    
+    elapsed = time.perf_counter() - start
+    summary = {
+        "imported": imported,
+        "rejected": rejected,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(imported / elapsed, 1) if elapsed > 0 else 0.0
+    }
+    if read_error:
+        summary["error"] = read_error
+    return summary
 
 class MESAS:
     def __init__(self):
-        self.db = Database()
+        # Imported here so CLI subcommands only load the modules they use
+        from modules.auth import AuthSystem
+        from modules.database import Database
+        from modules.medicine_manager import MedicineManager
+        from modules.reports import ReportGenerator
+        
+        # Instrumentation is opt-in; when disabled the real objects are used
+        # directly so there is no per-call overhead
+        self.perf_stats = PerfStats() if os.environ.get(INSTRUMENT_ENV) == "1" else None
+        self.profile_next_action = False
+        
+        self.db = self._instrument(Database(), "Database")
         self.auth = AuthSystem(self.db)
-        self.medicine_manager = MedicineManager(self.db)
-        self.report_generator = ReportGenerator(self.db, self.medicine_manager)
+        self.medicine_manager = self._instrument(MedicineManager(self.db), "MedicineManager")
+        self.report_generator = self._instrument(
+            ReportGenerator(self.db, self.medicine_manager), "ReportGenerator"
+        )
         self.running = True
+        # Alerts are cached between redraws and only recomputed after a
+        # medicine change or when the date rolls over
+        self._alerts_cache = None
+        self._alerts_date = None
+        # Main menu options 1-5; shared by normal and profiled dispatch
+        self.menu_actions = {
+            "1": self.medicine_management_menu,
+            "2": self.view_alerts_menu,
+            "3": self.reports_menu,
+            "4": self.view_all_medicines,
+            "5": self.search_medicine_menu
+        }
+    
+    def _instrument(self, target, prefix):
+        """Wrap target in a timing proxy when instrumentation is enabled"""
+        if self.perf_stats is None:
+            return target
+        return Instrumented(target, prefix, self.perf_stats)
     
     def clear_screen(self):
         """Clear console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            # ANSI clear + cursor home avoids spawning a shell on every screen
+            print("\033[2J\033[H", end="", flush=True)
     
     def display_header(self):
         """Display application header"""
@@ -34,6 +258,20 @@ class MESAS:
             print(f"User: {user['username']} | Role: {user['role']}")
         print()
     
+    def invalidate_alerts(self):
+        """Mark cached alerts as stale after an inventory change"""
+        self._alerts_cache = None
+    
+    def get_active_alerts(self):
+        """Return current alerts, rescanning only when inventory or date changed"""
+        today = datetime.date.today()
+        if self._alerts_cache is None or self._alerts_date != today:
+            self.medicine_manager.check_expiry_alerts()
+            self.medicine_manager.check_stock_alerts()
+            self._alerts_cache = self.medicine_manager.get_all_alerts()
+            self._alerts_date = today
+        return self._alerts_cache
+    
     def main_menu(self):
         """Display main menu"""
         while self.running:
@@ -42,9 +280,7 @@ class MESAS:
             
             # Check for alerts automatically
             if self.auth.is_authenticated():
-                self.medicine_manager.check_expiry_alerts()
-                self.medicine_manager.check_stock_alerts()
-                all_alerts = self.medicine_manager.get_all_alerts()
+                all_alerts = self.get_active_alerts()
                 
                 if all_alerts:
                     print("⚠️  ACTIVE ALERTS:")
@@ -87,16 +323,13 @@ class MESAS:
                 
                 choice = input("Enter your choice: ").strip()
                 
-                if choice == "1":
-                    self.medicine_management_menu()
-                elif choice == "2":
-                    self.view_alerts_menu()
-                elif choice == "3":
-                    self.reports_menu()
-                elif choice == "4":
-                    self.view_all_medicines()
-                elif choice == "5":
-                    self.search_medicine_menu()
+                action = self.menu_actions.get(choice)
+                
+                if action and self.profile_next_action:
+                    self.profile_next_action = False
+                    self.run_profiled(action)
+                elif action:
+                    action()
                 elif choice == "6" and self.auth.is_admin():
                     self.admin_menu()
                 elif choice == "7":
@@ -166,6 +399,7 @@ class MESAS:
         user_id = self.auth.get_current_user()["id"]
         for name, category, stock, price, expiry in sample_medicines:
             self.medicine_manager.add_medicine(name, category, stock, price, expiry, user_id)
+        self.invalidate_alerts()
         
         print("\nSample medicine data has been added to your inventory.")
     
@@ -180,7 +414,8 @@ class MESAS:
             print("2. Update Medicine Stock")
             print("3. Update Medicine Expiry Date")
             print("4. Delete Medicine")
-            print("5. Back to Main Menu")
+            print("5. Import Medicines from File (CSV/JSONL)")
+            print("6. Back to Main Menu")
             print("-" * 40)
             
             choice = input("Enter your choice: ").strip()
@@ -194,6 +429,8 @@ class MESAS:
             elif choice == "4":
                 self.delete_medicine_menu()
             elif choice == "5":
+                self.import_medicines_menu()
+            elif choice == "6":
                 break
             else:
                 print("\nInvalid choice. Please try again.")
@@ -223,10 +460,42 @@ class MESAS:
         success, message = self.medicine_manager.add_medicine(
             name, category, stock, price, expiry_date, user_id
         )
+        if success:
+            self.invalidate_alerts()
         
         print(f"\n{message}")
         input("\nPress Enter to continue...")
     
+    def import_medicines_menu(self):
+        """Import medicines from a CSV or JSONL file"""
+        self.clear_screen()
+        self.display_header()
+        print("IMPORT MEDICINES")
+        print("-" * 40)
+        print("Columns: name, category, stock, price, expiry_date (YYYY-MM-DD)")
+        
+        path = input("File path: ").strip()
+        if not os.path.isfile(path):
+            print("\nFile not found.")
+            input("Press Enter to continue...")
+            return
+        
+        user_id = self.auth.get_current_user()["id"]
+        summary = import_medicines(self.medicine_manager, path, user_id)
+        
+        if summary["imported"]:
+            self.invalidate_alerts()
+        
+        if "error" in summary:
+            print(f"\n{summary['error']}")
+            print("Import stopped early; rows before the error were saved.")
+        print(f"\nImported: {summary['imported']}")
+        print(f"Rejected: {summary['rejected']}")
+        for row_no, error in summary["errors"]:
+            print(f"  • Row {row_no}: {error}")
+        print(f"Time: {summary['seconds']}s ({summary['rows_per_second']} rows/s)")
+        input("\nPress Enter to continue...")
+    
     def update_stock_menu(self):
         """Update medicine stock"""
         self.clear_screen()
@@ -243,6 +512,8 @@ class MESAS:
             return
         
         success, message = self.medicine_manager.update_stock(medicine_id, new_stock)
+        if success:
+            self.invalidate_alerts()
         print(f"\n{message}")
         input("\nPress Enter to continue...")
     
@@ -263,6 +534,8 @@ class MESAS:
         new_expiry = input("New Expiry Date (YYYY-MM-DD): ").strip()
         
         success, message = self.medicine_manager.update_expiry(medicine_id, new_expiry)
+        if success:
+            self.invalidate_alerts()
         print(f"\n{message}")
         input("\nPress Enter to continue...")
     
@@ -287,6 +560,8 @@ class MESAS:
             
             if confirm == 'yes':
                 success, message = self.medicine_manager.delete_medicine(medicine_id)
+                if success:
+                    self.invalidate_alerts()
                 print(f"\n{message}")
             else:
                 print("\nDeletion cancelled.")
@@ -302,9 +577,7 @@ class MESAS:
         print("ACTIVE ALERTS")
         print("-" * 60)
         
-        self.medicine_manager.check_expiry_alerts()
-        self.medicine_manager.check_stock_alerts()
-        all_alerts = self.medicine_manager.get_all_alerts()
+        all_alerts = self.get_active_alerts()
         
         if not all_alerts:
             print("No active alerts at the moment.")
@@ -382,110 +655,167 @@ class MESAS:
         
         input("\nPress Enter to continue...")
     
+    def paginate(self, title, rows, header, format_row, width=80, page_size=PAGE_SIZE,
+                 start_at_end=False, jump_key=None, empty_message="No records to display."):
+        """Page through rows, formatting only the rows on the visible page"""
+        total = len(rows)
+        pages = max(1, (total + page_size - 1) // page_size)
+        page = pages - 1 if start_at_end else 0
+        
+        while True:
+            self.clear_screen()
+            self.display_header()
+            print(title)
+            print("=" * width)
+            
+            if not total:
+                print(empty_message)
+                print("=" * width)
+                input("\nPress Enter to continue...")
+                return
+            
+            print(header)
+            print("-" * width)
+            
+            start = page * page_size
+            for i in range(start, min(start + page_size, total)):
+                print(format_row(rows[i]))
+            
+            print("=" * width)
+            print(f"Page {page + 1} of {pages} | Total: {total}")
+            
+            options = "[n]ext  [p]rev  [g]o to page"
+            if jump_key:
+                options += "  [j]ump to letter"
+            choice = input(f"{options}  [q]uit: ").strip().lower()
+            
+            if choice in ("n", ""):
+                if page + 1 < pages:
+                    page += 1
+                elif choice == "":
+                    return
+            elif choice == "p":
+                page = max(0, page - 1)
+            elif choice == "g":
+                try:
+                    page = min(pages, max(1, int(input("Page number: ").strip()))) - 1
+                except ValueError:
+                    pass
+            elif choice == "j" and jump_key:
+                letter = input("Letter: ").strip()[:1].upper()
+                if letter:
+                    # The sort order of the rows is not guaranteed to be
+                    # case-insensitive, so scan for the first matching initial
+                    index = next((i for i in range(total) if jump_key(rows[i]) == letter), None)
+                    if index is not None:
+                        page = index // page_size
+            elif choice == "q":
+                return
+    
     def generate_expiry_report(self):
         """Generate and display expiry report"""
-        self.clear_screen()
-        self.display_header()
-        print("EXPIRY REPORT")
-        print("=" * 60)
-        
         report = self.report_generator.generate_expiry_report()
         
-        print(f"Total Expired: {report['total_expired']}")
-        print(f"Expiring Soon (30 days): {report['total_expiring_soon']}")
-        print("-" * 60)
-        
-        if report['expired_medicines']:
-            print("\n❌ EXPIRED MEDICINES:")
-            for med in report['expired_medicines'][:10]:
-                print(f"  • {med['name']} (ID: {med['id']}) - Expired on {med['expiry_date']}")
-            if len(report['expired_medicines']) > 10:
-                print(f"  ... and {len(report['expired_medicines']) - 10} more")
-        
-        if report['expiring_soon']:
-            print("\n⚠️  EXPIRING SOON (within 30 days):")
-            for item in report['expiring_soon'][:10]:
-                print(f"  • {item['name']} (ID: {item['id']}) - Expires in {item['days_until_expiry']} days")
-            if len(report['expiring_soon']) > 10:
-                print(f"  ... and {len(report['expiring_soon']) - 10} more")
-        
-        print("=" * 60)
-        input("\nPress Enter to continue...")
+        while True:
+            self.clear_screen()
+            self.display_header()
+            print("EXPIRY REPORT")
+            print("=" * 60)
+            print(f"Total Expired: {report['total_expired']}")
+            print(f"Expiring Soon (30 days): {report['total_expiring_soon']}")
+            print("=" * 60)
+            print("1. Browse Expired Medicines")
+            print("2. Browse Medicines Expiring Soon")
+            print("3. Back")
+            print("-" * 40)
+            
+            choice = input("Enter your choice: ").strip()
+            
+            if choice == "1":
+                self.paginate(
+                    "❌ EXPIRED MEDICINES", report['expired_medicines'],
+                    f"{'ID':<5} {'Name':<20} {'Expired On':<12}",
+                    lambda med: f"{med['id']:<5} {med['name']:<20} {med['expiry_date']:<12}",
+                    width=60, empty_message="No expired medicines."
+                )
+            elif choice == "2":
+                self.paginate(
+                    "⚠️  EXPIRING SOON (within 30 days)", report['expiring_soon'],
+                    f"{'ID':<5} {'Name':<20} {'Days Left':<10}",
+                    lambda item: f"{item['id']:<5} {item['name']:<20} {item['days_until_expiry']:<10}",
+                    width=60, empty_message="No medicines expiring in the next 30 days."
+                )
+            elif choice == "3" or choice == "":
+                break
+            else:
+                print("\nInvalid choice. Please try again.")
+                input("Press Enter to continue...")
     
     def generate_stock_report(self):
         """Generate and display stock report"""
-        self.clear_screen()
-        self.display_header()
-        print("STOCK REPORT")
-        print("=" * 60)
-        
         report = self.report_generator.generate_stock_report()
         
-        print(f"Out of Stock: {report['total_out_of_stock']}")
-        print(f"Low Stock (≤5 units): {report['total_low_stock']}")
-        print(f"Adequate Stock: {report['total_healthy_stock']}")
-        print("-" * 60)
-        
-        if report['out_of_stock']:
-            print("\n❌ OUT OF STOCK:")
-            for med in report['out_of_stock'][:10]:
-                print(f"  • {med['name']} (ID: {med['id']}) - {med['category']}")
-        
-        if report['low_stock']:
-            print("\n⚠️  LOW STOCK (≤5 units):")
-            for med in report['low_stock'][:10]:
-                print(f"  • {med['name']} (ID: {med['id']}) - {med['stock']} units left")
-        
-        print("=" * 60)
-        input("\nPress Enter to continue...")
+        while True:
+            self.clear_screen()
+            self.display_header()
+            print("STOCK REPORT")
+            print("=" * 60)
+            print(f"Out of Stock: {report['total_out_of_stock']}")
+            print(f"Low Stock (≤5 units): {report['total_low_stock']}")
+            print(f"Adequate Stock: {report['total_healthy_stock']}")
+            print("=" * 60)
+            print("1. Browse Out of Stock")
+            print("2. Browse Low Stock")
+            print("3. Back")
+            print("-" * 40)
+            
+            choice = input("Enter your choice: ").strip()
+            
+            if choice == "1":
+                self.paginate(
+                    "❌ OUT OF STOCK", report['out_of_stock'],
+                    f"{'ID':<5} {'Name':<20} {'Category':<15}",
+                    lambda med: f"{med['id']:<5} {med['name']:<20} {med['category']:<15}",
+                    width=60, empty_message="No medicines are out of stock."
+                )
+            elif choice == "2":
+                self.paginate(
+                    "⚠️  LOW STOCK (≤5 units)", report['low_stock'],
+                    f"{'ID':<5} {'Name':<20} {'Units Left':<10}",
+                    lambda med: f"{med['id']:<5} {med['name']:<20} {med['stock']:<10}",
+                    width=60, empty_message="No medicines are low on stock."
+                )
+            elif choice == "3" or choice == "":
+                break
+            else:
+                print("\nInvalid choice. Please try again.")
+                input("Press Enter to continue...")
     
     def view_report_history(self):
         """View previous reports"""
-        self.clear_screen()
-        self.display_header()
-        print("REPORT HISTORY")
-        print("=" * 80)
-        
-        reports = self.db.data["reports"]
+        def format_report(report):
+            date_str = datetime.datetime.fromisoformat(report['report_date']).strftime("%Y-%m-%d %H:%M")
+            return (f"{report['id']:<5} {date_str:<20} {report['total_medicines']:<12} "
+                    f"{report['expired_count']:<10} {report['low_stock_count']:<10} "
+                    f"₹{report['total_stock_value']:<12.2f}")
         
-        if not reports:
-            print("No reports generated yet.")
-        else:
-            print(f"{'ID':<5} {'Date':<20} {'Total Meds':<12} {'Expired':<10} {'Low Stock':<10} {'Total Value':<15}")
-            print("-" * 80)
-            
-            for report in reports[-10:]:
-                date_str = datetime.datetime.fromisoformat(report['report_date']).strftime("%Y-%m-%d %H:%M")
-                print(f"{report['id']:<5} {date_str:<20} {report['total_medicines']:<12} "
-                      f"{report['expired_count']:<10} {report['low_stock_count']:<10} "
-                      f"₹{report['total_stock_value']:<12.2f}")
-        
-        print("=" * 80)
-        input("\nPress Enter to continue...")
+        # Open on the most recent page, as the old last-10 view did
+        self.paginate(
+            "REPORT HISTORY", self.db.data["reports"],
+            f"{'ID':<5} {'Date':<20} {'Total Meds':<12} {'Expired':<10} {'Low Stock':<10} {'Total Value':<15}",
+            format_report, start_at_end=True, empty_message="No reports generated yet."
+        )
     
     def view_all_medicines(self):
         """View all medicines in inventory"""
-        self.clear_screen()
-        self.display_header()
-        print("ALL MEDICINES IN INVENTORY")
-        print("=" * 80)
-        
-        medicines = self.medicine_manager.get_sorted_medicines()
-        
-        if not medicines:
-            print("No medicines in inventory.")
-        else:
-            print(f"{'ID':<5} {'Name':<20} {'Category':<15} {'Stock':<10} {'Price':<10} {'Expiry':<12}")
-            print("-" * 80)
-            
-            for med in medicines:
-                print(f"{med['id']:<5} {med['name']:<20} {med['category']:<15} "
-                      f"{med['stock']:<10} ₹{med['price']:<8.2f} {med['expiry_date']:<12}")
-            
-            print("=" * 80)
-            print(f"Total Medicines: {len(medicines)}")
-        
-        input("\nPress Enter to continue...")
+        self.paginate(
+            "ALL MEDICINES IN INVENTORY", self.medicine_manager.get_sorted_medicines(),
+            f"{'ID':<5} {'Name':<20} {'Category':<15} {'Stock':<10} {'Price':<10} {'Expiry':<12}",
+            lambda med: (f"{med['id']:<5} {med['name']:<20} {med['category']:<15} "
+                         f"{med['stock']:<10} ₹{med['price']:<8.2f} {med['expiry_date']:<12}"),
+            jump_key=lambda med: med['name'][:1].upper(),
+            empty_message="No medicines in inventory."
+        )
     
     def search_medicine_menu(self):
         """Search medicine"""
@@ -518,7 +848,9 @@ class MESAS:
         print("-" * 40)
         print("1. View All Users")
         print("2. System Statistics")
-        print("3. Back to Main Menu")
+        print("3. Performance Statistics")
+        print("4. Profile Next Menu Action")
+        print("5. Back to Main Menu")
         print("-" * 40)
         
         choice = input("Enter your choice: ").strip()
@@ -528,6 +860,11 @@ class MESAS:
         elif choice == "2":
             self.system_statistics()
         elif choice == "3":
+            self.performance_statistics()
+        elif choice == "4":
+            self.profile_next_action = True
+            print("\nThe next main menu action will run under cProfile and tracemalloc.")
+        elif choice == "5":
             return
         else:
             print("\nInvalid choice.")
@@ -579,9 +916,159 @@ class MESAS:
         total_value = sum(m["price"] * m["stock"] for m in self.db.data["medicines"])
         print(f"Total Inventory Value: ₹{total_value:.2f}")
         print("=" * 60)
+    
+    def performance_statistics(self):
+        """Display per-operation call counts and latencies"""
+        self.clear_screen()
+        self.display_header()
+        print("PERFORMANCE STATISTICS")
+        print("=" * 80)
+        
+        if self.perf_stats is None:
+            print(f"Instrumentation is disabled. Start MESAS with {INSTRUMENT_ENV}=1 to enable it.")
+            print("=" * 80)
+            return
+        
+        stats = self.perf_stats.to_dict()
+        if not stats:
+            print("No operations recorded yet.")
+        else:
+            print(f"{'Operation':<45} {'Calls':<8} {'Avg (ms)':<10} {'Max (ms)':<10}")
+            print("-" * 80)
+            for name, op in stats.items():
+                print(f"{name:<45} {op['calls']:<8} {op['avg_ms']:<10.3f} {op['max_ms']:<10.3f}")
+        print("=" * 80)
+        
+        dump = input("Save as JSON? (yes/no): ").strip().lower()
+        if dump == "yes":
+            path = f"perf_stats_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(stats, f, indent=2)
+            print(f"Saved to {path}")
+    
+    def run_profiled(self, action):
+        """Run one menu action under cProfile and tracemalloc and save the results"""
+        import cProfile
+        import pstats
+        import tracemalloc
+        
+        profiler = cProfile.Profile()
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        profile_path = f"profile_{stamp}.prof"
+        memory_path = f"profile_{stamp}_memory.txt"
+        
+        tracemalloc.start()
+        try:
+            profiler.runcall(action)
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            # Saved even if the action fails; reporting only runs on success
+            tracemalloc.stop()
+            profiler.dump_stats(profile_path)
+        
+        with open(memory_path, "w", encoding="utf-8") as f:
+            f.write(f"Current: {current} bytes, Peak: {peak} bytes\n\n")
+            for stat in snapshot.statistics("lineno")[:25]:
+                f.write(f"{stat}\n")
+        
+        print(f"\nProfile saved to {profile_path} (memory: {memory_path})")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(10)
+        input("Press Enter to continue...")
+
+def _open_inventory():
+    """Load the database and medicine manager without the interactive app"""
+    from modules.database import Database
+    from modules.medicine_manager import MedicineManager
+    
+    db = Database()
+    return db, MedicineManager(db)
+
+def _require_user(db, user_id):
+    """Fail unless user_id belongs to a registered user"""
+    if not any(user["id"] == user_id for user in db.data["users"]):
+        raise ValueError(f"Unknown user id: {user_id}")
+
+def _cli_report(args):
+    """Generate an inventory, expiry or stock report"""
+    from modules.reports import ReportGenerator
+    
+    db, medicine_manager = _open_inventory()
+    _require_user(db, args.user_id)
+    report_generator = ReportGenerator(db, medicine_manager)
+    
+    if args.kind == "inventory":
+        return report_generator.generate_inventory_report(args.user_id)
+    elif args.kind == "expiry":
+        return report_generator.generate_expiry_report()
+    return report_generator.generate_stock_report()
+
+def _cli_alerts(args):
+    """Run expiry and stock checks and return the active alerts"""
+    _, medicine_manager = _open_inventory()
+    medicine_manager.check_expiry_alerts()
+    medicine_manager.check_stock_alerts()
+    alerts = medicine_manager.get_all_alerts()
+    return {"total": len(alerts), "alerts": alerts}
+
+def _cli_search(args):
+    """Search medicines by name or category"""
+    _, medicine_manager = _open_inventory()
+    results = medicine_manager.search_medicine(args.keyword)
+    return {"total": len(results), "results": results[:args.limit]}
+
+def _cli_import(args):
+    """Bulk import medicines from a CSV or JSONL file"""
+    if not os.path.isfile(args.file):
+        raise FileNotFoundError(f"File not found: {args.file}")
+    db, medicine_manager = _open_inventory()
+    _require_user(db, args.user_id)
+    return import_medicines(medicine_manager, args.file, args.user_id, args.batch_size)
+
+def run_cli(argv):
+    """Non-interactive entry point: run one subcommand and print JSON"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="mesas", description="MESAS batch mode")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    report_parser = subparsers.add_parser("report", help="generate a report")
+    report_parser.add_argument("kind", choices=["inventory", "expiry", "stock"])
+    report_parser.add_argument("--user-id", type=int, required=True,
+                               help="user recorded as the report author")
+    report_parser.set_defaults(handler=_cli_report)
+    
+    alerts_parser = subparsers.add_parser("alerts", help="list active alerts")
+    alerts_parser.set_defaults(handler=_cli_alerts)
+    
+    search_parser = subparsers.add_parser("search", help="search medicines")
+    search_parser.add_argument("keyword")
+    search_parser.add_argument("--limit", type=int, default=50)
+    search_parser.set_defaults(handler=_cli_search)
+    
+    import_parser = subparsers.add_parser("import", help="import medicines from CSV/JSONL")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--user-id", type=int, required=True,
+                               help="user recorded as the adding user")
+    import_parser.add_argument("--batch-size", type=int, default=1000)
+    import_parser.set_defaults(handler=_cli_import)
+    
+    args = parser.parse_args(argv)
+    try:
+        result = args.handler(args)
+    except Exception as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        return 1
+    
+    print(json.dumps(result, indent=2, default=str))
+    # A partial import still prints its summary but fails the command
+    return 1 if "error" in result else 0
 
 def main():
     """Main application entry point"""
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+    
     try:
         app = MESAS()
         app.main_menu()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MESAS helpers that do not need the modules package
+"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import main
+
+
+class FakeMedicineManager:
+    """Records add_medicine calls; rejects names listed in `reject`"""
+
+    def __init__(self, reject=()):
+        self.added = []
+        self.reject = set(reject)
+
+    def add_medicine(self, name, category, stock, price, expiry_date, user_id):
+        if name in self.reject:
+            return False, f"Medicine {name} already exists"
+        self.added.append((name, category, stock, price, expiry_date, user_id))
+        return True, "Medicine added successfully"
+
+
+class TempFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write_file(self, name, content, encoding="utf-8"):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "w", encoding=encoding, newline="") as f:
+            f.write(content)
+        return path
+
+    def write_truncated_csv(self, good_rows=500):
+        """CSV whose invalid UTF-8 sits past the first read buffer"""
+        path = os.path.join(self.tmpdir, "broken.csv")
+        rows = "".join(f"Med{i},Tablet,10,1.0,2025-01-01\n" for i in range(good_rows))
+        with open(path, "wb") as f:
+            f.write(("name,category,stock,price,expiry_date\n" + rows).encode("utf-8"))
+            f.write(b"Bad\xff\xfe,Tablet,1,1.0,2025-01-01\n")
+        return path
+
+
+class TestValidateMedicineRows(unittest.TestCase):
+    def row(self, **overrides):
+        record = {"name": "Paracetamol", "category": "Tablet", "stock": "10",
+                  "price": "5.50", "expiry_date": "2025-12-31"}
+        record.update(overrides)
+        return record
+
+    def test_valid_row(self):
+        valid, errors = main._validate_medicine_rows([(1, self.row())])
+        self.assertEqual(valid, [(1, "Paracetamol", "Tablet", 10, 5.5, "2025-12-31")])
+        self.assertEqual(errors, [])
+
+    def test_bad_types(self):
+        valid, errors = main._validate_medicine_rows([
+            (1, self.row(stock="ten")),
+            (2, self.row(price="free")),
+        ])
+        self.assertEqual(valid, [])
+        self.assertEqual([row_no for row_no, _ in errors], [1, 2])
+
+    def test_negative_values(self):
+        valid, errors = main._validate_medicine_rows([
+            (1, self.row(stock="-1")),
+            (2, self.row(price="-0.5")),
+        ])
+        self.assertEqual(valid, [])
+        self.assertEqual(len(errors), 2)
+
+    def test_bad_dates(self):
+        valid, errors = main._validate_medicine_rows([
+            (1, self.row(expiry_date="31/12/2025")),
+            (2, self.row(expiry_date="2025-02-30")),
+        ])
+        self.assertEqual(valid, [])
+        self.assertEqual(len(errors), 2)
+
+    def test_missing_columns(self):
+        record = self.row()
+        del record["category"]
+        valid, errors = main._validate_medicine_rows([(1, record), (2, self.row(name=" "))])
+        self.assertEqual(valid, [])
+        self.assertIn("category", errors[0][1])
+        self.assertEqual(errors[1][0], 2)
+
+    def test_non_finite_price(self):
+        valid, errors = main._validate_medicine_rows([
+            (1, self.row(price="nan")),
+            (2, self.row(price="inf")),
+            (3, self.row(price=float("-inf"))),
+        ])
+        self.assertEqual(valid, [])
+        self.assertEqual([row_no for row_no, _ in errors], [1, 2, 3])
+
+    def test_null_values(self):
+        valid, errors = main._validate_medicine_rows([
+            (1, self.row(name=None)),
+            (2, self.row(category=None)),
+            (3, self.row(stock=None)),
+        ])
+        self.assertEqual(valid, [])
+        self.assertIn("name is empty", errors[0][1])
+        self.assertEqual([row_no for row_no, _ in errors], [1, 2, 3])
+
+    def test_json_numbers(self):
+        valid, errors = main._validate_medicine_rows([
+            (1, self.row(stock=1000.0, price=5)),
+            (2, self.row(stock=2.5)),
+            (3, self.row(stock=True)),
+        ])
+        self.assertEqual(valid, [(1, "Paracetamol", "Tablet", 1000, 5.0, "2025-12-31")])
+        self.assertEqual([row_no for row_no, _ in errors], [2, 3])
+
+    def test_jsonl_line_decoded(self):
+        valid, errors = main._validate_medicine_rows([
+            (1, '{"name": "Aspirin", "category": "Tablet", "stock": 3, '
+                '"price": 4.5, "expiry_date": "2025-10-15"}'),
+            (2, "{not json"),
+            (3, "[1, 2, 3]"),
+        ])
+        self.assertEqual(valid, [(1, "Aspirin", "Tablet", 3, 4.5, "2025-10-15")])
+        self.assertEqual([row_no for row_no, _ in errors], [2, 3])
+
+
+class TestReadMedicineFile(TempFileTestCase):
+    CSV = ("name,category,stock,price,expiry_date\n"
+           "Paracetamol,Tablet,100,5.50,2025-12-31\n"
+           "Amoxicillin,Capsule,x,12.75,2025-06-30\n"
+           "Cetirizine,Tablet,30,8.25,2025-03-15\n")
+
+    def test_csv_batches(self):
+        path = self.write_file("meds.csv", self.CSV)
+        batches = list(main.read_medicine_file(path, batch_size=2))
+        self.assertEqual(len(batches), 2)
+        valid = [row for batch_valid, _ in batches for row in batch_valid]
+        errors = [error for _, batch_errors in batches for error in batch_errors]
+        self.assertEqual([row[1] for row in valid], ["Paracetamol", "Cetirizine"])
+        # Row numbers are file lines, so the header is line 1
+        self.assertEqual([row_no for row_no, _ in errors], [3])
+
+    def test_csv_with_bom(self):
+        path = self.write_file("meds.csv", self.CSV, encoding="utf-8-sig")
+        valid, errors = next(main.read_medicine_file(path))
+        self.assertEqual(len(valid), 2)
+        self.assertEqual(len(errors), 1)
+
+    def test_jsonl_with_malformed_line(self):
+        path = self.write_file("meds.jsonl", (
+            '{"name": "Aspirin", "category": "Tablet", "stock": 10, "price": 4.5, "expiry_date": "2025-10-15"}\n'
+            '{"name": "Broken", \n'
+            '\n'
+            '{"name": "Zinc", "category": "Tablet", "stock": 5, "price": 2, "expiry_date": "2026-01-01"}\n'
+            '{"name": "Broken again"\n'
+        ))
+        batches = list(main.read_medicine_file(path, batch_size=1))
+        valid = [row for batch_valid, _ in batches for row in batch_valid]
+        errors = [error for _, batch_errors in batches for error in batch_errors]
+        self.assertEqual([(row[0], row[1]) for row in valid], [(1, "Aspirin"), (4, "Zinc")])
+        # Blank lines are skipped but still counted
+        self.assertEqual([row_no for row_no, _ in errors], [2, 5])
+
+
+class TestImportMedicines(TempFileTestCase):
+    def test_summary_and_row_numbers(self):
+        path = self.write_file("meds.csv", (
+            "name,category,stock,price,expiry_date\n"
+            "Paracetamol,Tablet,100,5.50,2025-12-31\n"
+            "Aspirin,Tablet,10,4.50,2025-10-15\n"
+            "Zinc,Tablet,-5,2.00,2026-01-01\n"
+        ))
+        manager = FakeMedicineManager(reject={"Aspirin"})
+        summary = main.import_medicines(manager, path, user_id=1, batch_size=2)
+        self.assertEqual(summary["imported"], 1)
+        self.assertEqual(summary["rejected"], 2)
+        self.assertEqual([row_no for row_no, _ in summary["errors"]], [3, 4])
+        self.assertEqual(manager.added[0][-1], 1)
+
+    def test_read_error_reports_partial_import(self):
+        path = self.write_truncated_csv()
+        manager = FakeMedicineManager()
+        summary = main.import_medicines(manager, path, user_id=1, batch_size=100)
+        self.assertIn("Could not read file", summary["error"])
+        self.assertGreater(summary["imported"], 0)
+        self.assertEqual(summary["imported"], len(manager.added))
+
+    def test_errors_are_capped(self):
+        rows = "".join(f"Med{i},Tablet,bad,1.0,2025-01-01\n" for i in range(50))
+        path = self.write_file("meds.csv", "name,category,stock,price,expiry_date\n" + rows)
+        summary = main.import_medicines(FakeMedicineManager(), path, user_id=1)
+        self.assertEqual(summary["rejected"], 50)
+        self.assertEqual(len(summary["errors"]), main.MAX_REPORTED_ERRORS)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.data = {"users": [{"id": 1, "username": "admin"}], "medicines": [],
+                     "alerts": [], "reports": []}
+
+
+class TestRunCli(TempFileTestCase):
+    def run_cli(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = main.run_cli(list(argv))
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_requires_subcommand(self):
+        with self.assertRaises(SystemExit):
+            self.run_cli()
+
+    def test_rejects_unknown_report_kind(self):
+        with self.assertRaises(SystemExit):
+            self.run_cli("report", "sales", "--user-id", "1")
+
+    def test_report_requires_user_id(self):
+        with self.assertRaises(SystemExit):
+            self.run_cli("report", "inventory")
+
+    def test_import_rejects_unknown_user(self):
+        path = self.write_file("meds.csv", "name,category,stock,price,expiry_date\n")
+        with mock.patch.object(main, "_open_inventory",
+                               return_value=(FakeDatabase(), FakeMedicineManager())):
+            code, stdout, stderr = self.run_cli("import", path, "--user-id", "9")
+        self.assertEqual(code, 1)
+        self.assertEqual(stdout, "")
+        self.assertIn("Unknown user id", json.loads(stderr)["error"])
+
+    def test_import_read_error_prints_summary_and_fails(self):
+        path = self.write_truncated_csv()
+        manager = FakeMedicineManager()
+        with mock.patch.object(main, "_open_inventory", return_value=(FakeDatabase(), manager)):
+            code, stdout, _ = self.run_cli("import", path, "--user-id", "1", "--batch-size", "100")
+        self.assertEqual(code, 1)
+        summary = json.loads(stdout)
+        self.assertIn("error", summary)
+        self.assertEqual(summary["imported"], len(manager.added))
+
+    def test_import_prints_json_summary(self):
+        path = self.write_file("meds.csv", (
+            "name,category,stock,price,expiry_date\n"
+            "Paracetamol,Tablet,100,5.50,2025-12-31\n"
+        ))
+        manager = FakeMedicineManager()
+        with mock.patch.object(main, "_open_inventory", return_value=(FakeDatabase(), manager)):
+            code, stdout, _ = self.run_cli("import", path, "--user-id", "1", "--batch-size", "10")
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(stdout)["imported"], 1)
+        self.assertEqual(manager.added[0][-1], 1)
+
+
+class FakeAuth:
+    current_user = None
+
+
+class TestPaginate(unittest.TestCase):
+    # Ordinary case-sensitive sort: capitalised names come first
+    MEDICINES = [{"name": name} for name in
+                 ["Aspirin", "Benadryl", "Paracetamol", "Zinc",
+                  "amoxicillin", "cetirizine", "ibuprofen"]]
+
+    def paginate(self, *inputs):
+        app = main.MESAS.__new__(main.MESAS)
+        app.auth = FakeAuth()
+        stdout = io.StringIO()
+        with mock.patch("builtins.input", side_effect=list(inputs)), redirect_stdout(stdout):
+            app.paginate("MEDICINES", self.MEDICINES, "Name", lambda med: med["name"],
+                         page_size=3, jump_key=lambda med: med["name"][:1].upper())
+        return stdout.getvalue()
+
+    def test_formats_only_visible_page(self):
+        output = self.paginate("q")
+        self.assertIn("Page 1 of 3 | Total: 7", output)
+        self.assertIn("Benadryl", output)
+        self.assertNotIn("Zinc", output)
+
+    def test_jump_to_letter_with_case_sensitive_order(self):
+        output = self.paginate("j", "C", "q")
+        last_page = output.rsplit("MEDICINES", 1)[1]
+        self.assertIn("Page 2 of 3", last_page)
+        self.assertIn("cetirizine", last_page)
+
+    def test_jump_to_missing_letter_keeps_page(self):
+        output = self.paginate("n", "j", "X", "q")
+        self.assertIn("Page 2 of 3", output.rsplit("MEDICINES", 1)[1])
+
+    def test_empty_list_shows_caller_message(self):
+        app = main.MESAS.__new__(main.MESAS)
+        app.auth = FakeAuth()
+        stdout = io.StringIO()
+        with mock.patch("builtins.input", return_value=""), redirect_stdout(stdout):
+            app.paginate("MEDICINES", [], "Name", lambda med: med["name"],
+                         empty_message="No medicines in inventory.")
+        self.assertIn("No medicines in inventory.", stdout.getvalue())
+        self.assertNotIn("Page 1", stdout.getvalue())
+
+    def test_next_and_previous_stay_in_range(self):
+        output = self.paginate("p", "n", "n", "n", "q")
+        pages = [line.split(" |")[0] for line in output.splitlines() if line.startswith("Page ")]
+        self.assertEqual(pages, ["Page 1 of 3", "Page 1 of 3", "Page 2 of 3",
+                                 "Page 3 of 3", "Page 3 of 3"])
+
+
+class TestPerfStats(unittest.TestCase):
+    def test_histogram_buckets(self):
+        stats = main.PerfStats()
+        for elapsed_ms in (0.05, 0.1, 0.5, 5, 50, 500, 5000):
+            stats.record("Database.get_all_medicines", elapsed_ms)
+        op = stats.to_dict()["Database.get_all_medicines"]
+        self.assertEqual(op["calls"], 7)
+        self.assertEqual(op["max_ms"], 5000)
+        self.assertEqual(op["histogram"], {
+            "<=0.1ms": 2, "<=1ms": 1, "<=10ms": 1, "<=100ms": 1,
+            "<=1000ms": 1, ">1000ms": 1
+        })
+
+    def test_averages_per_operation(self):
+        stats = main.PerfStats()
+        stats.record("ReportGenerator.generate_stock_report", 2.0)
+        stats.record("ReportGenerator.generate_stock_report", 4.0)
+        stats.record("MedicineManager.search_medicine", 1.0)
+        result = stats.to_dict()
+        self.assertEqual(list(result), ["MedicineManager.search_medicine",
+                                        "ReportGenerator.generate_stock_report"])
+        self.assertEqual(result["ReportGenerator.generate_stock_report"]["avg_ms"], 3.0)
+        json.dumps(result)
+
+    def test_instrumented_proxy_records_calls(self):
+        stats = main.PerfStats()
+        manager = main.Instrumented(FakeMedicineManager(), "MedicineManager", stats)
+        manager.add_medicine("Zinc", "Tablet", 5, 2.0, "2026-01-01", 1)
+        self.assertEqual(manager.added[0][0], "Zinc")
+        self.assertEqual(stats.to_dict()["MedicineManager.add_medicine"]["calls"], 1)
+
+
+
+class TestRunProfiled(TempFileTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        super().tearDown()
+
+    def test_interrupted_action_does_not_prompt(self):
+        def action():
+            raise KeyboardInterrupt
+
+        app = main.MESAS.__new__(main.MESAS)
+        with mock.patch("builtins.input") as prompt, redirect_stdout(io.StringIO()):
+            with self.assertRaises(KeyboardInterrupt):
+                app.run_profiled(action)
+        prompt.assert_not_called()
+        self.assertTrue(any(name.endswith(".prof") for name in os.listdir(self.tmpdir)))
+
+    def test_saves_profile_and_memory_report(self):
+        app = main.MESAS.__new__(main.MESAS)
+        with mock.patch("builtins.input"), redirect_stdout(io.StringIO()):
+            app.run_profiled(lambda: sum(range(1000)))
+        names = os.listdir(self.tmpdir)
+        self.assertTrue(any(name.endswith(".prof") for name in names))
+        self.assertTrue(any(name.endswith("_memory.txt") for name in names))
+
+
+if __name__ == "__main__":
+    unittest.main()